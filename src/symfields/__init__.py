@@ -1,12 +1,41 @@
 """SymFields - Symbolic field relationships with automatic inversion."""
 
+import abc
+import hashlib
 import inspect
 import math
-from collections.abc import Callable, Sequence
+import os
+import pickle
+import sys
+from collections.abc import Callable, Collection, Iterable, Mapping, Sequence
 from dataclasses import dataclass
-from typing import Annotated, Any, TypeVar, Union, get_args, get_origin
-
-from sympy import Eq, Expr, Symbol, solve
+from functools import lru_cache, partial
+from graphlib import CycleError, TopologicalSorter
+from operator import attrgetter
+from types import CodeType, FunctionType
+from typing import Annotated, Any, ClassVar, Optional, TypeVar, Union, get_args, get_origin
+
+import sympy
+from sympy import (
+    Basic,
+    Dummy,
+    Eq,
+    Expr,
+    Symbol,
+    SympifyError,
+    Tuple,
+    default_sort_key,
+    lambdify,
+    linear_eq_to_matrix,
+    nan,
+    oo,
+    solve,
+    srepr,
+    sympify,
+    true,
+    zoo,
+)
+from sympy.solvers.solveset import NonlinearError
 from typing_extensions import Self, dataclass_transform
 
 __all__ = ["S", "SymFields", "replace"]
@@ -14,6 +43,30 @@ __all__ = ["S", "SymFields", "replace"]
 # TypeVar for replace() to preserve concrete type
 T = TypeVar("T", bound="SymFields")
 
+# Generated field-assignment code, shared by classes with the same field layout
+_ASSIGN_CODE_CACHE: dict[tuple[tuple[str, ...], bool], CodeType] = {}
+
+# Generated __init__ code, shared by classes with the same fields
+_INIT_CODE_CACHE: dict[tuple[tuple[str, ...], str], CodeType] = {}
+
+# How update() handles a set of changed free fields: (equation indices, fields they define,
+# skippable constraint indices, generated evaluation function)
+_ForwardPlan = tuple[
+    tuple[int, ...], tuple[str, ...], frozenset[int], Optional[Callable[[dict[str, Any]], bool]]
+]
+
+
+class _MissingType:
+    """Default for generated __init__ parameters, marking fields that weren't provided."""
+
+    __slots__ = ()
+
+    def __repr__(self) -> str:
+        return "<missing>"
+
+
+_MISSING: Any = _MissingType()
+
 
 class _SentinelSymbol:
     """Sentinel that can also create Symbols or wrap callables.
@@ -22,8 +75,14 @@ class _SentinelSymbol:
     1. A sentinel value for type checking (field: float = S)
     2. A Symbol factory function (S('name') returns Symbol('name'))
     3. A callable wrapper for type safety (S(lambda ...) returns the lambda)
+
+    Symbols are interned by name, so every S('a') in a class body returns the same object.
     """
 
+    __slots__ = ()
+
+    _symbols: ClassVar[dict[str, Symbol]] = {}
+
     def __call__(self, name_or_callable: Union[str, Callable[..., Any]]) -> Any:
         """Create a symbolic variable or wrap a callable for type safety.
 
@@ -34,7 +93,11 @@ class _SentinelSymbol:
             Symbol if given a string, or the callable as-is if given a callable
         """
         if isinstance(name_or_callable, str):
-            return Symbol(name_or_callable)
+            try:
+                return self._symbols[name_or_callable]
+            except KeyError:
+                name = sys.intern(name_or_callable)
+                return self._symbols.setdefault(name, Symbol(name))
         else:
             # Return callable as-is for type safety with mypy
             return name_or_callable
@@ -74,7 +137,7 @@ def _extract_real_solution(solutions: Any, unknowns_list: list[str]) -> dict[Sym
         real_solutions = []
         for sol in solutions:
             if isinstance(sol, tuple) and all(
-                not hasattr(v, "is_real") or v.is_real is not False for v in sol
+                getattr(v, "is_real", None) is not False for v in sol
             ):
                 real_solutions.append(sol)
 
@@ -92,8 +155,434 @@ def _extract_real_solution(solutions: Any, unknowns_list: list[str]) -> dict[Sym
     return {}
 
 
+# Directory for persisting symbolic solutions across processes; disabled unless set
+_CACHE_DIR_ENV = "SYMFIELDS_CACHE_DIR"
+
+# Symbolic solutions computed in this process, shared by classes with the same rules
+_SOLVE_CACHE: dict[tuple[tuple[Eq, ...], tuple[Symbol, ...]], list[dict[Symbol, Expr]]] = {}
+
+
+def _solve_linear(
+    equations: list[Eq], unknowns: list[Symbol]
+) -> Optional[list[dict[Symbol, Expr]]]:
+    """Solve equations directly with LU decomposition if they're linear in the unknowns.
+
+    Most rules (sums, unit conversions, scaled differences) are linear, and for those
+    solve() spends most of its time in heuristics that aren't needed.
+
+    Args:
+        equations: Equations to solve
+        unknowns: Symbols to solve for
+
+    Returns:
+        The unique solution in the format of solve(..., dict=True), or None if the
+        system isn't square and linear with a non-singular coefficient matrix
+    """
+    if len(equations) != len(unknowns):
+        return None
+    try:
+        A, b = linear_eq_to_matrix([eq.lhs - eq.rhs for eq in equations], unknowns)
+    except NonlinearError:
+        return None
+    if A.det() == 0:
+        return None
+    return [dict(zip(unknowns, A.LUsolve(b)))]
+
+
+def _solve_cached(equations: list[Eq], unknowns: list[Symbol]) -> list[dict[Symbol, Expr]]:
+    """Solve equations symbolically, reusing earlier results for the same system.
+
+    Results are kept in memory, so classes sharing a rule (e.g. the same sum or unit
+    conversion) solve it only once per process. When the SYMFIELDS_CACHE_DIR environment
+    variable is set, solutions are also pickled there under a hash of the equations, the
+    unknowns and the sympy version, so the expensive solve() only runs the first time a
+    given system is seen by any process.
+
+    Args:
+        equations: Equations to solve
+        unknowns: Symbols to solve for
+
+    Returns:
+        Solutions in the format of solve(..., dict=True)
+    """
+    memory_key = (tuple(equations), tuple(unknowns))
+    if memory_key in _SOLVE_CACHE:
+        return _SOLVE_CACHE[memory_key]
+
+    cache_dir = os.environ.get(_CACHE_DIR_ENV)
+    if not cache_dir:
+        solutions = _SOLVE_CACHE[memory_key] = solve(equations, unknowns, dict=True)
+        return solutions  # type: ignore[no-any-return]
+
+    key = srepr((tuple(equations), tuple(unknowns), sympy.__version__))
+    path = os.path.join(cache_dir, hashlib.sha1(key.encode()).hexdigest() + ".pickle")
+    try:
+        with open(path, "rb") as f:
+            solutions = _SOLVE_CACHE[memory_key] = pickle.load(f)
+            return solutions  # type: ignore[no-any-return]
+    except Exception:
+        pass
+
+    solutions = _SOLVE_CACHE[memory_key] = solve(equations, unknowns, dict=True)
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as f:
+            pickle.dump(solutions, f)
+        os.replace(tmp_path, path)
+    except OSError:
+        # The cache is an optimization; an unwritable directory shouldn't break solving
+        pass
+    return solutions  # type: ignore[no-any-return]
+
+
+def _substitute_solutions(
+    candidates: list[dict[str, Expr]], subs: dict[Symbol, Any], unknowns_list: list[str]
+) -> Any:
+    """Substitute known values into cached symbolic solutions.
+
+    The result has the shape sympy's solve() returns for the substituted system: a dict
+    for a single solution, or a list of tuples ordered like unknowns_list for several.
+
+    Args:
+        candidates: Symbolic solutions, mapping field names to expressions in known fields
+        subs: Known values keyed by Symbol
+        unknowns_list: Unknown field names, in the order used for tuple solutions
+
+    Returns:
+        Substituted solutions, or None if they can't be trusted for these values (no
+        candidates, or a candidate that degenerates to nan/infinity, stays symbolic or
+        can't be told real or complex), in which case the caller should solve the
+        substituted system instead.
+    """
+    if not candidates:
+        return None
+
+    substituted = []
+    for candidate in candidates:
+        values = tuple(sympify(candidate[name].xreplace(subs)) for name in unknowns_list)
+        for value in values:
+            if value.free_symbols or value.has(nan, zoo, oo, -oo):
+                return None
+            # e.g. -(-1)**(1/3) + (-1)**(5/6)*sqrt(3); solve() would simplify it
+            if value.is_real is None:
+                return None
+        substituted.append(values)
+
+    if len(substituted) == 1:
+        return {Symbol(name): value for name, value in zip(unknowns_list, substituted[0])}
+    # solve() sorts the solutions of the substituted system, which decides which branch
+    # is chosen (e.g. asin(s) before pi - asin(s)), so sort them the same way
+    substituted.sort(key=default_sort_key)
+    return substituted
+
+
+def _array_module(arrays: Iterable[Any]) -> Any:
+    """Pick the array library to evaluate a batch with.
+
+    CuPy arrays are kept on the GPU by evaluating with CuPy; everything else goes
+    through NumPy. CuPy is only imported when one of its arrays is passed in.
+
+    Args:
+        arrays: Input values, as passed to from_arrays()
+
+    Returns:
+        The cupy module if any input is a CuPy array, else the numpy module
+    """
+    for value in arrays:
+        if type(value).__module__.partition(".")[0] == "cupy":
+            import cupy
+
+            return cupy
+
+    import numpy
+
+    return numpy
+
+
+def _compile_solutions(
+    candidates: list[dict[str, Expr]], arg_names: tuple[str, ...], unknowns_list: list[str]
+) -> Optional[Callable[..., Any]]:
+    """Compile symbolic solutions into a single function of the known fields.
+
+    Every candidate is generated into one function with common subexpressions
+    eliminated, so terms shared between unknowns or between branches (e.g. the same
+    square root in both roots of a quadratic) are computed once per call.
+
+    Args:
+        candidates: Symbolic solutions, mapping field names to expressions in known fields
+        arg_names: Known field names, in the order the function takes them
+        unknowns_list: Unknown field names, in the order each candidate's tuple lists them
+
+    Returns:
+        Function returning a list with one tuple of unknown values per candidate, or None
+        if sympy can't compile the solutions
+    """
+    try:
+        return lambdify(  # type: ignore[no-any-return]
+            [Symbol(name) for name in arg_names],
+            [tuple(candidate[name] for name in unknowns_list) for candidate in candidates],
+            modules="math",
+            cse=True,
+            dummify=True,
+        )
+    except Exception:
+        return None
+
+
+def _compile_expr(
+    expr: Expr, cse: bool = False
+) -> Optional[tuple[Callable[..., Any], tuple[str, ...]]]:
+    """Compile a sympy expression into a plain Python function of its free symbols.
+
+    Walking the expression tree with subs() on every evaluation is slow; lambdify()
+    generates equivalent Python source once so evaluation becomes a single call.
+
+    Args:
+        expr: Sympy expression to compile (a Tuple compiles to a function returning a tuple)
+        cse: Whether to compute common subexpressions only once
+
+    Returns:
+        Tuple of (function, argument names), or None if sympy can't compile the expression
+    """
+    arg_names = tuple(sorted(str(s) for s in expr.free_symbols))
+    try:
+        func = lambdify(
+            [Symbol(name) for name in arg_names], expr, modules="math", cse=cse, dummify=True
+        )
+    except Exception:
+        return None
+    return func, arg_names
+
+
+def _evaluate(
+    expr: Expr,
+    compiled: Optional[tuple[Callable[..., Any], tuple[str, ...]]],
+    values: Mapping[str, Any],
+) -> Any:
+    """Evaluate a sympy expression for the given field values.
+
+    The compiled form is tried first. If it fails (e.g. Decimal mixed with float
+    constants, math domain errors, division by zero) or produces anything but a plain
+    int, float, bool or sympy object (a complex number, or a Decimal or Fraction computed
+    from such inputs), we fall back to sympy. Construction solves Decimal and Fraction
+    inputs with sympy too, so a value comes out as the same type whichever path
+    computed it.
+
+    Args:
+        expr: Sympy expression to evaluate
+        compiled: Result of _compile_expr() for expr
+        values: Mapping of field names to values; must cover expr's free symbols
+
+    Returns:
+        The evaluated value (a plain Python number or a sympy object)
+    """
+    if compiled is not None:
+        func, arg_names = compiled
+        try:
+            result = func(*[values[name] for name in arg_names])
+        except Exception:
+            pass
+        else:
+            if type(result) in (float, int, bool) or isinstance(result, Basic):
+                return result
+    # Only Symbols are ever replaced, and only by numbers, so the exact-match xreplace()
+    # can stand in for subs() without its general substitution machinery. The results
+    # differ for 0/0: subs() replaces one symbol at a time, so 0/speed cancels to 0 before
+    # speed becomes 0, while xreplace() replaces them together and gives nan, which
+    # callers reject as undefined.
+    # sympify() because a bare Symbol is replaced by the raw (unsympified) value.
+    return sympify(expr.xreplace({s: values[str(s)] for s in expr.free_symbols}))
+
+
+def _is_tautology(constraint: Any) -> bool:
+    """Check whether a constraint holds for any real field values (e.g. a**2 >= 0).
+
+    Fields hold real numbers, so the constraint's symbols are replaced with real ones
+    and sympy's automatic evaluation decides it.
+
+    Args:
+        constraint: A constraint from __constraints__
+
+    Returns:
+        True if the constraint is always satisfied
+    """
+    try:
+        constraint = sympify(constraint)
+    except SympifyError:
+        return False
+    real_symbols = {symbol: Dummy(real=True) for symbol in constraint.free_symbols}
+    return constraint.xreplace(real_symbols) is true
+
+
+def _satisfies(
+    constraint: Expr,
+    compiled: Optional[tuple[Callable[..., Any], tuple[str, ...]]],
+    values: Mapping[str, Any],
+) -> bool:
+    """Check whether field values satisfy a constraint.
+
+    Like _evaluate(), the compiled form is tried first with a sympy fallback.
+
+    Args:
+        constraint: Sympy relational to check
+        compiled: Result of _compile_expr() for constraint
+        values: Mapping of field names to values; must cover the constraint's fields
+
+    Returns:
+        Whether the constraint holds
+
+    Raises:
+        Exception: If the constraint can't be evaluated for these values (e.g. it compares
+            complex numbers, or refers to a field missing from values)
+    """
+    result = _evaluate(constraint, compiled, values)
+    return result is True or bool(result)
+
+
+def _make_assign(field_names: tuple[str, ...], post_init: bool) -> Callable[[Any, Any], None]:
+    """Generate a function that stores solved field values on an instance.
+
+    This replaces the dataclass-generated __init__: once every field has been solved
+    there is nothing left for it to do except assign, and going through it routes each
+    assignment through SymFields.__setattr__. The generated code is straight-line
+    object.__setattr__ calls (plus __post_init__ if the class defines one), and the
+    compiled code object is reused by every class with the same field layout.
+
+    Args:
+        field_names: Field names in definition order
+        post_init: Whether to call self.__post_init__() after assignment
+
+    Returns:
+        Function taking (instance, values_dict)
+    """
+    key = (field_names, post_init)
+    code = _ASSIGN_CODE_CACHE.get(key)
+    if code is None:
+        lines = ["def __symfields_assign__(self, values):"]
+        lines.extend(f"    _setattr(self, {name!r}, values[{name!r}])" for name in field_names)
+        if post_init:
+            lines.append("    self.__post_init__()")
+        if len(lines) == 1:
+            lines.append("    pass")
+        module_code = compile("\n".join(lines), "<symfields assign>", "exec")
+        code = next(c for c in module_code.co_consts if isinstance(c, CodeType))
+        _ASSIGN_CODE_CACHE[key] = code
+    return FunctionType(code, {"_setattr": object.__setattr__})
+
+
+def _make_init(
+    field_names: tuple[str, ...],
+    qualname: str,
+    solve_fields: Callable[[Any, dict[str, Any], int], None],
+) -> Callable[..., None]:
+    """Generate an __init__ with one keyword-only parameter per field.
+
+    Parameters default to _MISSING, so the provided fields are found with identity
+    checks and Python itself rejects unexpected keyword arguments, instead of checking
+    every name in a **kwargs dict. The same checks build an integer bitmask of the
+    provided fields, which is a cheaper cache key than a frozenset of their names.
+    It also gives the class a real signature for inspect.signature() and help().
+
+    Args:
+        field_names: Field names in definition order
+        qualname: Qualified name of the generated function, used in error messages
+        solve_fields: Function taking (instance, provided_values_dict, provided_mask) that
+            does the work, where bit i of the mask is set when field_names[i] was provided
+
+    Returns:
+        The generated __init__ function
+    """
+    key = (field_names, qualname)
+    code = _INIT_CODE_CACHE.get(key)
+    if code is None:
+        # Locals and globals use names that can't clash with field names
+        params = "".join(f", {name}" for name in field_names)
+        lines = [
+            f"def __init__(__symfields_self__{', *' if field_names else ''}{params}):",
+            "    __symfields_values__ = {}",
+            "    __symfields_mask__ = 0",
+        ]
+        for i, name in enumerate(field_names):
+            lines.append(f"    if {name} is not __symfields_missing__:")
+            lines.append(f"        __symfields_values__[{name!r}] = {name}")
+            lines.append(f"        __symfields_mask__ |= {1 << i}")
+        lines.append(
+            "    __symfields_solve__(__symfields_self__, __symfields_values__, __symfields_mask__)"
+        )
+        module_code = compile("\n".join(lines), "<symfields init>", "exec")
+        code = next(c for c in module_code.co_consts if isinstance(c, CodeType))
+        if sys.version_info >= (3, 11):
+            code = code.replace(co_qualname=qualname)
+        _INIT_CODE_CACHE[key] = code
+    init = FunctionType(
+        code, {"__symfields_missing__": _MISSING, "__symfields_solve__": solve_fields}
+    )
+    init.__kwdefaults__ = dict.fromkeys(field_names, _MISSING)
+    init.__qualname__ = qualname
+    return init
+
+
+def _make_forward(
+    steps: Sequence[tuple[str, Callable[..., Any], tuple[str, ...], Callable[[Any], Any]]],
+) -> Callable[[dict[str, Any]], bool]:
+    """Generate a function that evaluates a sequence of compiled equations.
+
+    The generated code calls each equation's compiled function with its arguments read
+    straight from the values dict and stores the cast result, with no per-equation
+    loop, tuple unpacking or fallback bookkeeping.
+
+    Args:
+        steps: (field name, compiled function, argument names, cast function) for each
+            equation, in the order to evaluate them
+
+    Returns:
+        Function taking a dict of field values and storing every field's new value in it.
+        It returns False, possibly after storing some of the values, if an evaluation
+        raises or gives anything but an int or float (see _evaluate()).
+    """
+    namespace: dict[str, Any] = {}
+    lines = ["def __symfields_forward__(values):", "    try:"]
+    for i, (field_name, func, arg_names, cast) in enumerate(steps):
+        namespace[f"_func{i}"] = func
+        namespace[f"_cast{i}"] = cast
+        args = ", ".join(f"values[{name!r}]" for name in arg_names)
+        lines.append(f"        value = _func{i}({args})")
+        lines.append("        if type(value) is not float and type(value) is not int:")
+        lines.append("            return False")
+        lines.append(f"        values[{field_name!r}] = _cast{i}(value)")
+    if not steps:
+        lines.append("        pass")
+    lines.extend(["    except Exception:", "        return False", "    return True"])
+    exec(compile("\n".join(lines), "<symfields forward>", "exec"), namespace)
+    forward: Callable[[dict[str, Any]], bool] = namespace["__symfields_forward__"]
+    return forward
+
+
+class _SymFieldsMeta(abc.ABCMeta):
+    """Metaclass that gives every SymFields subclass ``__slots__`` for its fields.
+
+    ``__slots__`` must be in the class namespace before the class is created, which is
+    too early for ``__init_subclass__``. Field defaults (``S``, sympy expressions,
+    callables) would clash with the slot descriptors, so they are moved to
+    ``_symfields_defaults`` where ``SymFields.__init_subclass__`` picks them up.
+    Deriving from ABCMeta lets classes also inherit from ``abc.ABC``.
+    """
+
+    def __new__(
+        mcls, name: str, bases: tuple[type, ...], namespace: dict[str, Any], **kwargs: Any
+    ) -> "_SymFieldsMeta":
+        if bases:
+            annotations = namespace.get("__annotations__", {})
+            namespace["_symfields_defaults"] = {
+                field: namespace.pop(field) for field in annotations if field in namespace
+            }
+            namespace.setdefault("__slots__", tuple(annotations))
+        return super().__new__(mcls, name, bases, namespace, **kwargs)
+
+
 @dataclass_transform(kw_only_default=True)
-class SymFields:
+class SymFields(metaclass=_SymFieldsMeta):
     """Base class for defining classes with symbolic field relationships.
 
     Fields can have symbolic expressions as defaults, which are automatically
@@ -116,6 +605,14 @@ class SymFields:
 
     __constraints__: Sequence[Expr]
 
+    # Field names in definition order, computed once per subclass
+    _symfields_fields: ClassVar[tuple[str, ...]] = ()
+    # Stores already-solved field values on an instance (see _make_assign())
+    _symfields_assign: ClassVar[Callable[[Any, Mapping[str, Any]], None]]
+
+    # Subclasses only add slots for their fields; instances stay weak-referenceable
+    __slots__ = ("__weakref__",)
+
     def update(self, **kwargs: Any) -> None:
         """Update field values and propagate changes through the constraint system."""
         ...  # Implementation added by __init_subclass__
@@ -124,9 +621,46 @@ class SymFields:
         """Set attribute and propagate changes through constraint system."""
         ...  # Implementation added by __init_subclass__
 
-    def __init_subclass__(cls) -> None:
-        """Process class definition to extract symbolic rules and lambdas."""
-        # Validate Annotated fields first
+    @classmethod
+    def from_arrays(cls, **arrays: Any) -> dict[str, Any]:  # type: ignore[empty-body]
+        """Solve for every field over whole arrays of input values at once."""
+        ...  # Implementation added by __init_subclass__
+
+    @classmethod
+    def to_arrays(cls, instances: Iterable[Self]) -> dict[str, Any]:
+        """Collect the fields of many instances into one NumPy array per field.
+
+        This is the inverse of from_arrays(): rows stored as instances are turned into
+        columns (struct-of-arrays) for vectorized processing. Requires NumPy.
+
+        Args:
+            instances: Instances of this class
+
+        Returns:
+            Dictionary mapping every field name to a NumPy array with one value per
+            instance
+
+        Example:
+            >>> Sum.to_arrays([Sum(a=1, b=2), Sum(a=3, b=4)])["c"]
+            array([3, 7])
+        """
+        import numpy as np
+
+        rows = list(instances)
+        return {
+            name: np.array([getattr(row, name) for row in rows]) for name in cls._symfields_fields
+        }
+
+    def __init_subclass__(cls, *, cache_size: int = 0) -> None:
+        """Process class definition to extract symbolic rules and lambdas.
+
+        Args:
+            cache_size: If nonzero, remember the solved fields of up to this many recent
+                constructions, so constructing again with the same arguments (equal
+                values of the same types) skips solving and validation
+        """
+        # Validate Annotated fields first, collecting their cast functions
+        cast_funcs: dict[str, Callable[[Any], Any]] = {}
         for name, annotation in cls.__annotations__.items():
             if get_origin(annotation) is Annotated:
                 args = get_args(annotation)
@@ -157,24 +691,32 @@ class SymFields:
                         f"got {len(params)}"
                     )
 
+                cast_funcs[name] = cast_func
+
         # Extract constraints if present
-        constraints = ()
+        constraints: tuple[Expr, ...] = ()
         if hasattr(cls, "__constraints__"):
-            constraints = tuple(cls.__constraints__)
+            # Constraints that can never fail don't need checking on every construction
+            constraints = tuple(c for c in cls.__constraints__ if not _is_tautology(c))
             delattr(cls, "__constraints__")
+        compiled_constraints = [(c, _compile_expr(c)) for c in constraints]
+        constraint_fields = [frozenset(str(s) for s in c.free_symbols) for c in constraints]
+
+        # Field defaults were moved aside by _SymFieldsMeta to make room for __slots__
+        defaults = cls.__dict__.get("_symfields_defaults", {})
+        if "_symfields_defaults" in cls.__dict__:
+            delattr(cls, "_symfields_defaults")
 
         equations, lambdas = [], {}
-        for name in cls.__annotations__:
-            if not hasattr(cls, name):
-                continue
-            if isinstance(getattr(cls, name), Expr):
-                equations.append(Eq(Symbol(name), getattr(cls, name)))
-            elif callable(getattr(cls, name)) and getattr(cls, name) is not S:
-                func = getattr(cls, name)
-                parameters = list(inspect.signature(func).parameters.values())
+        for name, default in defaults.items():
+            if isinstance(default, Expr):
+                equations.append(Eq(Symbol(name), default))
+            elif callable(default) and default is not S:
+                func = default
+                parameters = inspect.signature(func).parameters
 
                 # Validate parameters
-                for param in parameters:
+                for param in parameters.values():
                     if param.kind in (
                         inspect.Parameter.VAR_POSITIONAL,
                         inspect.Parameter.VAR_KEYWORD,
@@ -191,21 +733,340 @@ class SymFields:
                             "is not a defined field"
                         )
 
-                dependency_fields = list(inspect.signature(func).parameters.keys())
-                lambdas[name] = (func, dependency_fields)
-            delattr(cls, name)
+                lambdas[name] = (func, tuple(parameters))
+
+        # Lambdas in dependency order, so a single pass computes every lambda whose inputs
+        # are available. Lambdas may depend on each other cyclically (any one of them can be
+        # provided), in which case we keep definition order and iterate to a fixed point.
+        lambda_graph = {
+            name: [d for d in dependency_fields if d in lambdas]
+            for name, (_, dependency_fields) in lambdas.items()
+        }
+        try:
+            lambda_order = tuple(TopologicalSorter(lambda_graph).static_order())
+            lambdas_acyclic = True
+        except CycleError:
+            lambda_order = tuple(lambdas)
+            lambdas_acyclic = False
+        # (field, func, parameter names, parameter names as a set) in lambda_order
+        lambda_meta = tuple(
+            (name, lambdas[name][0], lambdas[name][1], frozenset(lambdas[name][1]))
+            for name in lambda_order
+        )
+
+        # Field bookkeeping is fixed at class creation, so compute it once
+        annotations = dict(cls.__annotations__)
+        field_names = tuple(sys.intern(name) for name in cls.__annotations__)
+        symbols = {name: Symbol(name) for name in field_names}  # Reused instead of Symbol(name)
+        # Reads every field in one call; with a single name attrgetter returns a bare value
+        get_field_values = attrgetter(*field_names) if len(field_names) > 1 else None
+        field_set = frozenset(field_names)
+        lambda_fields = frozenset(lambdas)
+        # Fields whose computed value is stored unchanged (float() doesn't round a float), so
+        # a finite value evaluated from a rule satisfies that rule and any constraint it was
+        # checked against
+        exact_fields = frozenset(
+            name for name in field_names if name not in cast_funcs and annotations[name] is float
+        )
+
+        # Compile the right-hand side of every equation once, for forward evaluation
+        compiled_rhs = {str(eq.lhs): _compile_expr(eq.rhs) for eq in equations}
+
+        # ...and all of them together with the constraints for validation, sharing common
+        # subexpressions: returns every right-hand side followed by every constraint's result
+        compiled_checks = (
+            _compile_expr(Tuple(*(eq.rhs for eq in equations), *constraints), cse=True)
+            if equations or constraints
+            else None
+        )
+
+        # Field names in each equation, so propagation doesn't re-derive them from sympy
+        # objects on every pass: (equation, lhs field, all fields, rhs fields)
+        eq_meta: list[tuple[Eq, str, frozenset[str], frozenset[str]]] = []
+        for eq in equations:
+            lhs_field = str(eq.lhs)
+            eq_fields = frozenset(str(s) for s in eq.free_symbols)
+            eq_meta.append((eq, lhs_field, eq_fields, eq_fields - {lhs_field}))
+        equation_fields = frozenset(lhs_field for _, lhs_field, _, _ in eq_meta)
+        # Indices into eq_meta of the equations involving each field, so update() only
+        # re-examines equations that a newly changed field may have made solvable
+        watchers = {
+            name: frozenset(i for i, (_, _, fields, _) in enumerate(eq_meta) if name in fields)
+            for name in field_names
+        }
+        # Fields no rule defines; changing only these never requires inverting a rule
+        root_fields = field_set - equation_fields - lambda_fields
+        # Indices into eq_meta in dependency order, so one pass evaluates every equation
+        # after the equations defining its inputs (None if the equations are cyclic)
+        equation_graph = {
+            lhs_field: [f for f in rhs_fields if f in equation_fields]
+            for _, lhs_field, _, rhs_fields in eq_meta
+        }
+        try:
+            equation_index = {lhs_field: i for i, (_, lhs_field, _, _) in enumerate(eq_meta)}
+            forward_order: Optional[tuple[int, ...]] = tuple(
+                equation_index[name] for name in TopologicalSorter(equation_graph).static_order()
+            )
+        except CycleError:
+            forward_order = None
+        # Propagation passes walk the equations forward in dependency order and backward in
+        # reverse, so a chain resolves in one pass whichever order it was defined in
+        forward_pass = forward_order if forward_order is not None else tuple(range(len(eq_meta)))
+        backward_pass = forward_pass[::-1]
 
         dataclass(cls, frozen=False)
-        original_init = cls.__init__
+        assign_fields = _make_assign(field_names, hasattr(cls, "__post_init__"))
+
+        solution_cache: dict[frozenset[str], list[dict[str, Expr]]] = {}
+        solver_cache: dict[
+            int,
+            tuple[frozenset[str], list[str], Optional[tuple[Callable[..., Any], tuple[str, ...]]]],
+        ] = {}
+        # update() plans when only free fields change, keyed by the set of updated fields
+        forward_plans: dict[frozenset[str], Optional[_ForwardPlan]] = {}
+        # from_arrays() functions, keyed by the set of provided fields and array module
+        array_funcs: dict[tuple[frozenset[str], str], dict[Expr, Callable[..., Any]]] = {}
+
+        def _symbolic_solutions(known: frozenset[str]) -> list[dict[str, Expr]]:
+            """Solve the equations for every non-lambda field missing from `known`.
 
-        def __init__(self: Self, **kwargs: Any) -> None:
-            known_fields = set(kwargs)
-            unknown_fields = set(cls.__annotations__) - known_fields
+            Known fields are left as free symbols, so the solutions hold for any values
+            and only need numbers substituted in. Results are cached per set of known
+            fields, so each combination is solved only once per class.
+
+            Args:
+                known: Names of the fields whose values will be provided
+
+            Returns:
+                List of candidate solutions, each mapping field names to expressions in
+                the known fields. Empty if the system can't be solved for these unknowns.
+            """
+            if known in solution_cache:
+                return solution_cache[known]
+
+            unknowns = [
+                symbols[name]
+                for name in field_names
+                if name not in known and name not in lambda_fields
+            ]
+            if not unknowns:
+                solution_cache[known] = [{}]
+                return solution_cache[known]
+
+            involved = [eq for eq in equations if eq.free_symbols & set(unknowns)]
+            try:
+                solutions = _solve_linear(involved, unknowns)
+                if solutions is None:
+                    solutions = _solve_cached(involved, unknowns)
+            except Exception:
+                # Some systems only solve once numbers are substituted in
+                solutions = []
+            solution_cache[known] = [
+                {str(symbol): value for symbol, value in solution.items()}
+                for solution in solutions
+                if len(solution) == len(unknowns)
+                and all(str(s) in known for value in solution.values() for s in value.free_symbols)
+            ]
+            return solution_cache[known]
+
+        def _solver_for(
+            mask: int, values: Mapping[str, Any]
+        ) -> tuple[frozenset[str], list[str], Optional[tuple[Callable[..., Any], tuple[str, ...]]]]:
+            """Look up the solving plan for a combination of provided fields.
+
+            The combination is identified by a bitmask with bit i set when field_names[i]
+            was provided, so after the first call for a combination no sets or lists need
+            to be built. The solutions are compiled together on that first call.
+
+            Args:
+                mask: Bitmask of the provided fields
+                values: Mapping of the provided field names to values
+
+            Returns:
+                Tuple of (known field names, unknown non-lambda field names in field order,
+                compiled solver and its argument names or None if it couldn't be compiled)
+            """
+            entry = solver_cache.get(mask)
+            if entry is None:
+                known = frozenset(values)
+                unknowns_list = [
+                    name for name in field_names if name not in known and name not in lambda_fields
+                ]
+                arg_names = tuple(name for name in field_names if name in known)
+                solver = None
+                if unknowns_list:
+                    candidates = _symbolic_solutions(known)
+                    if candidates:
+                        solver = _compile_solutions(candidates, arg_names, unknowns_list)
+                compiled = (solver, arg_names) if solver is not None else None
+                entry = solver_cache[mask] = (known, unknowns_list, compiled)
+            return entry
+
+        def _numeric_solutions(
+            compiled: Optional[tuple[Callable[..., Any], tuple[str, ...]]],
+            values: Mapping[str, Any],
+            unknowns_list: list[str],
+        ) -> Any:
+            """Evaluate the compiled symbolic solutions with a single call.
+
+            Only plain int/float inputs take this path; anything else (Decimal, sympy
+            numbers) goes through sympy so it keeps its precision. Candidates that are
+            clearly complex (e.g. the non-real cube roots) are dropped, as the sympy path
+            would never pick them.
+
+            Args:
+                compiled: Compiled solver and its argument names, from _solver_for()
+                values: Mapping of field names to provided values
+                unknowns_list: Unknown field names, in field order
+
+            Returns:
+                The single real solution as a dict, or None if this path doesn't apply, a
+                candidate isn't finite, a candidate is complex with an imaginary part that
+                may be rounding error, or there isn't exactly one real candidate
+            """
+            if compiled is None:
+                return None
+            solver, arg_names = compiled
+            args = [values[name] for name in arg_names]
+            if any(type(arg) not in (int, float) for arg in args):
+                return None
+            try:
+                results = solver(*args)
+            except Exception:
+                return None
+            real_results = []
+            for result in results:
+                is_real = True
+                for value in result:
+                    if not isinstance(value, complex):
+                        if not math.isfinite(value):
+                            return None
+                    elif abs(value.imag) > 1e-9 * abs(value):
+                        is_real = False
+                    else:
+                        # Could be a real root with rounding error; let sympy decide
+                        return None
+                if is_real:
+                    real_results.append(result)
+            # Which of several real candidates is chosen depends on how solve() orders them,
+            # which depends on the exact form of each value, so leave that to the sympy path
+            if len(real_results) != 1:
+                return None
+            return dict(zip([symbols[name] for name in unknowns_list], real_results[0]))
+
+        inverse_cache: dict[
+            tuple[Eq, str],
+            Optional[list[tuple[Expr, Optional[tuple[Callable[..., Any], tuple[str, ...]]]]]],
+        ] = {}
+
+        def _inverse_solutions(
+            eq: Eq, unknown_field: str, values: Mapping[str, Any]
+        ) -> Optional[list[Any]]:
+            """Solve one equation for one of its fields, given values for all the others.
+
+            The equation is inverted symbolically (and each branch compiled) the first
+            time a field is solved for, so later updates only evaluate the branches. Rules
+            linear in the field are inverted directly; others go through _solve_cached(),
+            so the inversion is shared with other classes using the same rule.
+
+            Args:
+                eq: The equation to invert
+                unknown_field: Name of the field to solve for
+                values: Mapping of field names to values; must cover the other fields
+
+            Returns:
+                The value of each solution branch, ordered like solve() returns them for
+                the substituted equation, or None if the equation can't be inverted
+                symbolically or a branch degenerates or can't be told real or complex for
+                these values
+            """
+            key = (eq, unknown_field)
+            if key not in inverse_cache:
+                symbol = symbols[unknown_field]
+                try:
+                    solutions = _solve_linear([eq], [symbol])
+                    if solutions is None:
+                        solutions = _solve_cached([eq], [symbol])
+                    branches = [solution[symbol] for solution in solutions if symbol in solution]
+                except Exception:
+                    branches = []
+                inverse_cache[key] = [
+                    (branch, _compile_expr(branch)) for branch in branches
+                ] or None
+
+            inverse = inverse_cache[key]
+            if inverse is None:
+                return None
+            results = [_evaluate(branch, compiled, values) for branch, compiled in inverse]
+            for value in results:
+                if isinstance(value, float) and not math.isfinite(value):
+                    return None
+                if isinstance(value, Basic) and (
+                    value.has(nan, zoo, oo, -oo) or value.is_real is None
+                ):
+                    return None
+            if len(results) > 1:
+                results.sort(key=lambda value: default_sort_key(sympify(value)))
+            return results
+
+        def _cast(field_name: str, value: Any) -> Any:
+            """Convert a computed value to its field's type.
+
+            Uses the Annotated cast function if there is one, else the annotation itself,
+            falling back to float if the annotation can't convert the value.
+
+            Args:
+                field_name: Name of the field the value is for
+                value: The computed value (a plain number or a sympy object)
+
+            Returns:
+                The converted value
+            """
+            cast_func = cast_funcs.get(field_name)
+            if cast_func is not None:
+                return cast_func(value)
+            try:
+                return annotations[field_name](value)
+            except (TypeError, ValueError):
+                return float(value)
+
+        def _solve_fields(kwargs: dict[str, Any], mask: int) -> dict[str, Any]:
+            """Solve and validate every field from the provided ones.
+
+            Args:
+                kwargs: Provided field values; solved fields are added to it
+                mask: Bitmask of the provided fields (see _make_init())
+
+            Returns:
+                kwargs, completed with every field's value
+            """
+            known, unknowns_list, compiled = _solver_for(mask, kwargs)
+            # Lambda fields computed here, which validation doesn't need to check again
+            derived: set[str] = set()
+            # Solved fields stored without rounding, so constraints checked on the chosen
+            # solution still hold for them. Their rules are still validated, since a symbolic
+            # solution can be an extraneous root or a 0/0 case.
+            unrounded: set[str] = set()
+            # Whether the chosen solution already passed every constraint
+            constraints_checked = False
+            known_fields = set(known)
+            unknown_fields = set(field_set)
+            unknown_fields -= known
 
             # Solve sympy equations as a system
-            subs = {Symbol(key): value for key, value in kwargs.items()}
-            unknowns_list = list(unknown_fields - lambdas.keys())
-            solutions_list = solve([eq.subs(subs) for eq in equations], unknowns_list)
+            solutions_list: Any
+            if not unknowns_list:
+                # Every non-lambda field was provided, so there's nothing to solve
+                solutions_list = {}
+            else:
+                solutions_list = _numeric_solutions(compiled, kwargs, unknowns_list)
+                if solutions_list is None:
+                    subs = {symbols[key]: value for key, value in kwargs.items()}
+                    solutions_list = _substitute_solutions(
+                        _symbolic_solutions(known), subs, unknowns_list
+                    )
+                if solutions_list is None:
+                    solutions_list = solve([eq.xreplace(subs) for eq in equations], unknowns_list)
 
             # Apply constraint filtering if constraints are defined
             # Only filter when there are multiple solutions; single solutions are validated later
@@ -213,57 +1074,60 @@ class SymFields:
             has_multiple_solutions = isinstance(solutions_list, list) and len(solutions_list) > 1
             if constraints and solutions_list and has_multiple_solutions:
                 filtered_solutions = []
-                failed_info = []
+                # (solution, failed constraints) pairs; only formatted if nothing passes
+                failed_info: list[tuple[Any, list[Expr]]] = []
+                # Known values plus the candidate being checked; candidates are swapped in
+                # and out rather than copying the known values for each one
+                complete_values = dict(kwargs)
 
                 for solution in solutions_list:
                     # Convert tuple solution to dict for constraint checking
                     if isinstance(solution, tuple):
-                        solution_dict = dict(zip([Symbol(s) for s in unknowns_list], solution))
+                        solution_dict = dict(zip([symbols[s] for s in unknowns_list], solution))
                     elif isinstance(solution, dict):
                         solution_dict = solution
                     else:
                         # Skip solutions we can't process
                         continue
 
-                    # Merge known values with the candidate solution for constraint checking
-                    complete_solution = {**subs, **solution_dict}
+                    for symbol, value in solution_dict.items():
+                        complete_values[symbol.name] = value
 
                     # Check all constraints for this solution
                     all_satisfied = True
                     failed_constraints = []
 
-                    for constraint in constraints:
+                    for constraint, compiled_constraint in compiled_constraints:
                         try:
-                            result = constraint.subs(complete_solution)  # type: ignore
                             # Evaluate the constraint - be strict
-                            is_false = result is False or (
-                                hasattr(result, "__bool__") and not bool(result)
-                            )
-                            if is_false:
+                            if not _satisfies(constraint, compiled_constraint, complete_values):
                                 all_satisfied = False
-                                failed_constraints.append(str(constraint))
+                                failed_constraints.append(constraint)
                         except Exception:
                             # If we can't evaluate, be conservative and reject
                             all_satisfied = False
-                            failed_constraints.append(str(constraint))
+                            failed_constraints.append(constraint)
+
+                    for symbol in solution_dict:
+                        del complete_values[symbol.name]
 
                     if all_satisfied:
                         filtered_solutions.append(solution)  # Keep original format
                     elif failed_constraints:
-                        failed_info.append(
-                            f"  Solution {solution_dict} failed: {', '.join(failed_constraints)}"
-                        )
+                        failed_info.append((solution_dict, failed_constraints))
 
                 if not filtered_solutions:
                     constraint_str = ", ".join(str(c) for c in constraints)
                     error_msg = (
                         f"No solutions satisfy all constraints.\nConstraints: [{constraint_str}]"
                     )
-                    if failed_info:
-                        error_msg += "\n" + "\n".join(failed_info)
+                    for solution_dict, failed_constraints in failed_info:
+                        failed_str = ", ".join(str(c) for c in failed_constraints)
+                        error_msg += f"\n  Solution {solution_dict} failed: {failed_str}"
                     raise ValueError(error_msg)
 
                 solutions_list = filtered_solutions
+                constraints_checked = True
 
             # Extract real-valued solution from sympy's output
             solutions_dict = _extract_real_solution(solutions_list, unknowns_list)
@@ -271,31 +1135,30 @@ class SymFields:
             # Extract solved values (skip if still symbolic or complex)
             for symbol, value in solutions_dict.items():
                 # Check if value is still symbolic (couldn't be fully solved)
-                if hasattr(value, "free_symbols") and value.free_symbols:
+                if getattr(value, "free_symbols", None):
                     continue
 
                 # Check if value is complex and skip it (prefer real solutions)
-                if hasattr(value, "is_real") and value.is_real is False:
+                if getattr(value, "is_real", None) is False:
                     continue
 
-                field_name = str(symbol)
-                annotation = cls.__annotations__[field_name]
-
-                # Check if using Annotated with cast function
-                if get_origin(annotation) is Annotated:
-                    _, cast_func = get_args(annotation)
-                    kwargs[field_name] = cast_func(value)
-                else:
-                    # Current behavior
-                    try:
-                        kwargs[field_name] = annotation(value)
-                    except (TypeError, ValueError):
-                        kwargs[field_name] = float(value)
+                field_name = symbol.name  # Much cheaper than str(), which runs sympy's printer
+                kwargs[field_name] = _cast(field_name, value)
+                if field_name in exact_fields and math.isfinite(kwargs[field_name]):
+                    unrounded.add(field_name)
                 known_fields.add(field_name)
                 unknown_fields.remove(field_name)
 
+            # Constraints over provided and exactly solved fields were checked when choosing
+            # the solution; only those involving other fields (lambdas, or fields rounded by
+            # a cast) need checking again
+            verified: list[int] = []
+            if constraints_checked:
+                trusted = unrounded | known
+                verified = [i for i, fields in enumerate(constraint_fields) if fields <= trusted]
+
             # Check if sympy couldn't solve everything
-            non_lambda_unknowns = unknown_fields - lambdas.keys()
+            non_lambda_unknowns = unknown_fields - lambda_fields
             if non_lambda_unknowns:
                 provided = ", ".join(f"'{f}'" for f in sorted(known_fields))
                 missing = ", ".join(f"'{f}'" for f in sorted(non_lambda_unknowns))
@@ -308,18 +1171,20 @@ class SymFields:
                     f"(not enough equations to solve for all unknowns)."
                 )
 
-            # Solve lambdas iteratively
+            # Solve lambdas in dependency order
             while unknown_fields:
                 progress = False
-                for field in list(unknown_fields):
-                    func, dependency_fields = lambdas[field]
-                    if known_fields >= set(dependency_fields):
+                for field, func, dependency_fields, dependency_set in lambda_meta:
+                    if field not in unknown_fields:
+                        continue
+                    if dependency_set <= known_fields:
                         call_kwargs = {param: kwargs[param] for param in dependency_fields}
                         kwargs[field] = func(**call_kwargs)
+                        derived.add(field)
                         known_fields.add(field)
                         unknown_fields.remove(field)
                         progress = True
-                if not progress:
+                if not progress or lambdas_acyclic:
                     break
 
             # Check if lambdas couldn't be calculated
@@ -348,9 +1213,27 @@ class SymFields:
                 raise ValueError("\n".join(error_lines))
 
             # Validate all equations and lambdas
-            _validate_fields(kwargs)
+            _validate_fields(kwargs, derived, verified)
 
-            original_init(self, **kwargs)
+            return kwargs
+
+        @lru_cache(maxsize=cache_size)
+        def _solve_memoized(mask: int, key: tuple[tuple[str, type, Any], ...]) -> dict[str, Any]:
+            return _solve_fields({name: value for name, _, value in key}, mask)
+
+        def _init_fields(self: Self, kwargs: dict[str, Any], mask: int) -> None:
+            if cache_size:
+                # Types are part of the key so that e.g. 1 and 1.0 aren't treated as the same
+                key = tuple((name, type(value), value) for name, value in kwargs.items())
+                try:
+                    hash(key)
+                except TypeError:
+                    pass  # Unhashable values can't be cached
+                else:
+                    # The cached dict is shared, but assign_fields() only reads from it
+                    assign_fields(self, _solve_memoized(mask, key))
+                    return
+            assign_fields(self, _solve_fields(kwargs, mask))
 
         def update(self: SymFields, **kwargs: Any) -> None:
             """Update field values and propagate changes through the constraint system.
@@ -361,65 +1244,98 @@ class SymFields:
             Raises:
                 ValueError: If update would create inconsistent or underconstrained state
             """
-            # Validate that all kwargs are valid fields
-            for field in kwargs:
-                if field not in cls.__annotations__:
-                    raise ValueError(f"Field '{field}' is not defined in {cls.__name__}")
+            # Validate that all kwargs are valid fields (one subset check in the common case)
+            if not field_set.issuperset(kwargs):
+                for field in kwargs:
+                    if field not in field_set:
+                        raise ValueError(f"Field '{field}' is not defined in {cls.__name__}")
+
+            # Writing back the values the fields already hold changes nothing (a value of
+            # another type, like 2.0 for 2, is still stored)
+            for field, value in kwargs.items():
+                current = getattr(self, field)
+                if current is not value and (type(current) is not type(value) or current != value):
+                    break
+            else:
+                return
 
             # Start with current values + updates
-            values = {field: getattr(self, field) for field in cls.__annotations__}
+            if get_field_values is not None:
+                values = dict(zip(field_names, get_field_values(self)))
+            else:
+                values = {field: getattr(self, field) for field in field_names}
             values.update(kwargs)
+
+            # Only fields no rule defines were changed: the equations depending on them are
+            # re-evaluated forward and everything else keeps its (already valid) value
+            if forward_order is not None and root_fields.issuperset(kwargs):
+                plan = _forward_plan(frozenset(kwargs))
+                forward_values = dict(values) if plan is not None else values
+                # The generated code covers the common case; the general evaluation only
+                # runs if it bails out, redoing every step with the sympy fallback
+                if plan is not None and (
+                    (plan[3] is not None and plan[3](forward_values))
+                    or _propagate_forward(forward_values, plan[0])
+                ):
+                    _, recomputed, verified, _ = plan
+                    # Only rules rounded by a cast, and constraints on changed fields, can fail
+                    derived = field_set.difference(
+                        f
+                        for f in recomputed
+                        if f not in exact_fields or not math.isfinite(forward_values[f])
+                    )
+                    _validate_fields(forward_values, derived, verified)
+                    for field in kwargs:
+                        object.__setattr__(self, field, forward_values[field])
+                    for field in recomputed:
+                        object.__setattr__(self, field, forward_values[field])
+                    return
+
             changed = set(kwargs.keys())
 
+            # Whether an equation can be used depends only on which of its fields have
+            # changed, so each pass skips equations with no newly changed fields
+            pending_forward: set[int] = set()
+            for field in changed:
+                pending_forward |= watchers[field]
+            pending_backward = set(pending_forward)
+
             # Propagation loop - forward and backward passes
             max_iterations = 100  # Safety limit
             for _ in range(max_iterations):
                 progress = False
 
                 # Forward pass: solve for LHS fields that aren't changed yet
-                for eq in equations:
-                    lhs_field = str(eq.lhs)
-                    eq_symbols = {str(s) for s in eq.free_symbols}
-                    rhs_symbols = eq_symbols - {lhs_field}
-
-                    # Forward: if LHS unchanged and all RHS known and at least one RHS changed
-                    if (
-                        lhs_field not in changed
-                        and all(s in values for s in rhs_symbols)
-                        and any(s in changed for s in rhs_symbols)
-                    ):
-                        # Substitute and solve
-                        subs = {Symbol(k): values[k] for k in rhs_symbols}
-                        new_value = eq.rhs.subs(subs)
+                for i in forward_pass:
+                    if i not in pending_forward:
+                        continue
+                    pending_forward.discard(i)
+                    eq, lhs_field, _, rhs_symbols = eq_meta[i]
+                    # Forward: if LHS unchanged and at least one RHS changed
+                    if lhs_field not in changed and not rhs_symbols.isdisjoint(changed):
+                        new_value = _evaluate(eq.rhs, compiled_rhs[lhs_field], values)
 
                         # Check if value is still symbolic
-                        if hasattr(new_value, "free_symbols") and new_value.free_symbols:
+                        if getattr(new_value, "free_symbols", None):
                             continue
 
                         # Check if value is complex
-                        if hasattr(new_value, "is_real") and new_value.is_real is False:
+                        if getattr(new_value, "is_real", None) is False:
                             continue
 
-                        # Apply cast function if using Annotated
-                        annotation = cls.__annotations__[lhs_field]
-                        if get_origin(annotation) is Annotated:
-                            _, cast_func = get_args(annotation)
-                            values[lhs_field] = cast_func(new_value)
-                        else:
-                            try:
-                                values[lhs_field] = annotation(new_value)
-                            except (TypeError, ValueError):
-                                values[lhs_field] = float(new_value)
+                        values[lhs_field] = _cast(lhs_field, new_value)
 
                         changed.add(lhs_field)
+                        pending_forward |= watchers[lhs_field]
+                        pending_backward |= watchers[lhs_field]
                         progress = True
 
                 # Backward pass: invert rules where LHS is changed and exactly one RHS is unknown
-                for eq in equations:
-                    lhs_field = str(eq.lhs)
-                    eq_symbols = {str(s) for s in eq.free_symbols}
-                    rhs_symbols = eq_symbols - {lhs_field}
-
+                for i in backward_pass:
+                    if i not in pending_backward:
+                        continue
+                    pending_backward.discard(i)
+                    eq, lhs_field, _, rhs_symbols = eq_meta[i]
                     # If LHS is changed, check for invertible rules
                     if lhs_field in changed:
                         unknown_rhs = rhs_symbols - changed
@@ -428,12 +1344,13 @@ class SymFields:
                         if len(unknown_rhs) == 1:
                             unknown_field = next(iter(unknown_rhs))
 
-                            # Substitute known values (changed fields + LHS)
-                            known_symbols = (changed & rhs_symbols) | {lhs_field}
-                            subs = {Symbol(k): values[k] for k in known_symbols}
-
-                            # Solve for the unknown field
-                            solutions_list = solve(eq.subs(subs), Symbol(unknown_field))
+                            # Solve for the unknown field, from the other fields' values
+                            solutions_list = _inverse_solutions(eq, unknown_field, values)
+                            if solutions_list is None:
+                                # Substitute known values (changed fields + LHS)
+                                known_symbols = (changed & rhs_symbols) | {lhs_field}
+                                subs = {symbols[k]: values[k] for k in known_symbols}
+                                solutions_list = solve(eq.xreplace(subs), symbols[unknown_field])
 
                             if solutions_list:
                                 # Extract solution
@@ -441,29 +1358,23 @@ class SymFields:
                                     # Filter for real solutions
                                     real_solutions = []
                                     for sol in solutions_list:
-                                        if not hasattr(sol, "is_real") or sol.is_real is not False:
+                                        if getattr(sol, "is_real", None) is not False:
                                             real_solutions.append(sol)
 
                                     # Apply constraint filtering if multiple solutions
                                     if constraints and len(real_solutions) > 1:
                                         filtered_solutions = []
+                                        complete_values = dict(values)
                                         for sol in real_solutions:
-                                            # Create complete solution for constraint checking
-                                            complete_solution = {
-                                                Symbol(k): v for k, v in values.items()
-                                            }
-                                            complete_solution[Symbol(unknown_field)] = sol
+                                            complete_values[unknown_field] = sol
 
                                             # Check all constraints
                                             all_satisfied = True
-                                            for constraint in constraints:
+                                            for constraint, compiled in compiled_constraints:
                                                 try:
-                                                    result = constraint.subs(complete_solution)  # type: ignore
-                                                    has_bool = hasattr(result, "__bool__")
-                                                    is_false = result is False or (
-                                                        has_bool and not bool(result)
-                                                    )
-                                                    if is_false:
+                                                    if not _satisfies(
+                                                        constraint, compiled, complete_values
+                                                    ):
                                                         all_satisfied = False
                                                         break
                                                 except Exception:
@@ -471,7 +1382,9 @@ class SymFields:
                                                     break
 
                                             if all_satisfied:
+                                                # Only the first satisfying solution is used
                                                 filtered_solutions.append(sol)
+                                                break
 
                                         if filtered_solutions:
                                             real_solutions = filtered_solutions
@@ -483,33 +1396,28 @@ class SymFields:
                                     solution = solutions_list
 
                                 # Check if solution is still symbolic
-                                if hasattr(solution, "free_symbols") and solution.free_symbols:
+                                if getattr(solution, "free_symbols", None):
                                     continue
 
                                 # Check if solution is complex
-                                if hasattr(solution, "is_real") and solution.is_real is False:
+                                if getattr(solution, "is_real", None) is False:
                                     continue
 
-                                # Apply cast function if using Annotated
-                                annotation = cls.__annotations__[unknown_field]
-                                if get_origin(annotation) is Annotated:
-                                    _, cast_func = get_args(annotation)
-                                    values[unknown_field] = cast_func(solution)
-                                else:
-                                    try:
-                                        values[unknown_field] = annotation(solution)
-                                    except (TypeError, ValueError):
-                                        values[unknown_field] = float(solution)
+                                values[unknown_field] = _cast(unknown_field, solution)
 
                                 changed.add(unknown_field)
+                                pending_forward |= watchers[unknown_field]
+                                pending_backward |= watchers[unknown_field]
                                 progress = True
 
                 # Handle lambdas - forward only
-                for field, (func, dependency_fields) in lambdas.items():
-                    if field not in changed and all(d in changed for d in dependency_fields):
+                for field, func, dependency_fields, dependency_set in lambda_meta:
+                    if field not in changed and dependency_set <= changed:
                         call_kwargs = {param: values[param] for param in dependency_fields}
                         values[field] = func(**call_kwargs)
                         changed.add(field)
+                        pending_forward |= watchers[field]
+                        pending_backward |= watchers[field]
                         progress = True
 
                 if not progress:
@@ -521,11 +1429,10 @@ class SymFields:
                 )
 
             # Check for fields in equations that couldn't be determined
-            for eq in equations:
-                eq_symbols = {str(s) for s in eq.free_symbols}
+            for _, _, eq_symbols, _ in eq_meta:
                 # If equation contains any changed field but not all fields are in changed, error
                 if eq_symbols & changed and not (eq_symbols <= changed):
-                    unsolved = eq_symbols - changed
+                    unsolved = set(eq_symbols - changed)
                     raise ValueError(
                         f"Cannot determine values for fields {unsolved} - "
                         f"update is ambiguous or under-constrained. "
@@ -539,30 +1446,127 @@ class SymFields:
             for field, value in values.items():
                 object.__setattr__(self, field, value)
 
-        def _validate_fields(values: dict[str, Any]) -> None:
+        def _forward_plan(
+            updated: frozenset[str],
+        ) -> Optional[_ForwardPlan]:
+            """Work out which rules are affected when only the given free fields change.
+
+            This depends only on which fields are updated, not on their values, so plans
+            are cached per set of updated fields.
+
+            Args:
+                updated: Names of the updated fields, none of which any rule defines
+
+            Returns:
+                Tuple of (indices into eq_meta of the equations to re-evaluate, in
+                dependency order; the fields they define; indices of the constraints
+                involving none of the changed fields; a generated function evaluating the
+                equations, or None if one of them couldn't be compiled), or None if a
+                lambda depends on a changed field, in which case the general propagation
+                is needed
+            """
+            if updated not in forward_plans:
+                dirty = set(updated)
+                steps = []
+                for i in forward_order or ():
+                    _, lhs_field, _, rhs_fields = eq_meta[i]
+                    if not rhs_fields.isdisjoint(dirty):
+                        steps.append(i)
+                        dirty.add(lhs_field)
+                if any(not dependency_set.isdisjoint(dirty) for *_, dependency_set in lambda_meta):
+                    forward_plans[updated] = None
+                else:
+                    recomputed = tuple(eq_meta[i][1] for i in steps)
+                    # Exact fields are cast with float(), which _cast() comes down to for them
+                    forward_steps = []
+                    for name in recomputed:
+                        compiled = compiled_rhs[name]
+                        if compiled is None:
+                            break
+                        cast = float if name in exact_fields else partial(_cast, name)
+                        forward_steps.append((name, *compiled, cast))
+                    forward_plans[updated] = (
+                        tuple(steps),
+                        recomputed,
+                        frozenset(
+                            i
+                            for i, fields in enumerate(constraint_fields)
+                            if fields.isdisjoint(dirty)
+                        ),
+                        _make_forward(forward_steps)
+                        if len(forward_steps) == len(recomputed)
+                        else None,
+                    )
+            return forward_plans[updated]
+
+        def _propagate_forward(values: dict[str, Any], steps: tuple[int, ...]) -> bool:
+            """Re-evaluate the given equations in order, storing the results in `values`.
+
+            Args:
+                values: Current field values, updated in place
+                steps: Indices into eq_meta of the equations to evaluate
+
+            Returns:
+                False if an equation didn't evaluate to a real number, in which case the
+                general propagation is needed
+            """
+            for i in steps:
+                eq, lhs_field, _, _ = eq_meta[i]
+                new_value = _evaluate(eq.rhs, compiled_rhs[lhs_field], values)
+                if getattr(new_value, "free_symbols", None):
+                    return False
+                if getattr(new_value, "is_real", None) is False:
+                    return False
+                values[lhs_field] = _cast(lhs_field, new_value)
+            return True
+
+        def _validate_fields(
+            values: dict[str, Any], derived: Collection[str] = (), verified: Collection[int] = ()
+        ) -> None:
             """Validate that all field values satisfy the defined rules.
 
             Args:
                 values: Dictionary mapping field names to their values
+                derived: Fields that were just computed from their own rules and can't
+                    violate them (lambda results, and values update() evaluated forward
+                    and stored without rounding); rules defining these fields are skipped
+                verified: Indices of constraints already known to hold for these values
 
             Raises:
                 ValueError: If any validation fails
             """
             validation_errors = []
 
-            # Validate sympy equations
-            for eq in equations:
-                field_name = str(eq.lhs)
-                eq_symbols = eq.free_symbols
-                subs_dict = {Symbol(k): v for k, v in values.items() if Symbol(k) in eq_symbols}
+            # Evaluate every right-hand side and constraint in one call; if that fails for
+            # these values, each is evaluated on its own with a sympy fallback
+            rhs_values = constraint_values = None
+            if compiled_checks is not None and (
+                len(verified) < len(constraints) or not all(f in derived for f in equation_fields)
+            ):
+                func, arg_names = compiled_checks
+                try:
+                    results = func(*[values[name] for name in arg_names])
+                except Exception:
+                    pass
+                else:
+                    rhs_values = results[: len(equations)]
+                    constraint_values = results[len(equations) :]
+                    if any(isinstance(value, complex) for value in rhs_values):
+                        rhs_values = constraint_values = None
 
-                lhs_value = eq.lhs.subs(subs_dict)
-                rhs_value = eq.rhs.subs(subs_dict)
+            # Validate sympy equations
+            for i, (eq, field_name, _, _) in enumerate(eq_meta):
+                if field_name in derived:
+                    continue
+                lhs_value = values[field_name]
+                if rhs_values is not None:
+                    rhs_value = rhs_values[i]
+                else:
+                    rhs_value = _evaluate(eq.rhs, compiled_rhs[field_name], values)
 
                 # Apply cast function to rhs_value if field has Annotated type
-                annotation = cls.__annotations__[field_name]
-                if get_origin(annotation) is Annotated:
-                    _, cast_func = get_args(annotation)
+                cast_func = cast_funcs.get(field_name)
+                if cast_func is not None:
                     rhs_value = cast_func(rhs_value)
 
                 # Convert to floats for comparison
@@ -590,6 +1594,8 @@ class SymFields:
 
             # Validate lambdas
             for field_name, (func, dependency_fields) in lambdas.items():
+                if field_name in derived:
+                    continue
                 expected = func(**{param: values[param] for param in dependency_fields})
                 actual = values[field_name]
 
@@ -614,16 +1620,16 @@ class SymFields:
                     validation_errors.append("\n".join(error_info))
 
             # Validate constraints
-            constraint: Expr
-            for constraint in constraints:
-                # Substitute field values into constraint
-                subs_dict = {Symbol(k): v for k, v in values.items()}
+            for i, (constraint, compiled_constraint) in enumerate(compiled_constraints):
+                if i in verified:
+                    continue
                 try:
-                    result: Any = constraint.subs(subs_dict)  # type: ignore
                     # Evaluate the constraint - be strict
-                    is_satisfied = result is True or (hasattr(result, "__bool__") and bool(result))
-
-                    if not is_satisfied:
+                    if constraint_values is not None:
+                        satisfied = bool(constraint_values[i])
+                    else:
+                        satisfied = _satisfies(constraint, compiled_constraint, values)
+                    if not satisfied:
                         error_info = [
                             f"  Constraint violated: {constraint}",
                             f"    Field values: {values}",
@@ -661,16 +1667,212 @@ class SymFields:
             """
             # Check if this is a defined field AND object is already initialized
             # (During __init__, fields don't exist yet, so hasattr returns False)
-            if name in cls.__annotations__ and hasattr(self, name):
+            if name in field_set and hasattr(self, name):
                 # Object is initialized, use update to propagate changes
                 self.update(**{name: value})
             else:
                 # During initialization or not a SymField - use normal setattr
                 object.__setattr__(self, name, value)
 
-        cls.__init__ = __init__  # type: ignore[assignment]
+        def from_arrays(**arrays: Any) -> dict[str, Any]:
+            """Solve for every field over whole arrays of input values at once.
+
+            The system is solved symbolically once and the solution is evaluated with
+            NumPy over the full arrays (struct-of-arrays), instead of constructing and
+            solving one instance per row. Requires NumPy. If CuPy arrays are passed,
+            the solution is evaluated on the GPU with CuPy and CuPy arrays are returned.
+
+            When equations have several solutions, each row uses the real one that
+            satisfies the class constraints which constructing an instance would pick.
+            Rows where more than one qualifies are ordered with sympy one by one, so
+            they are much slower than the rest. Values are floating-point arrays;
+            field types and Annotated cast functions are not applied.
+
+            Args:
+                **arrays: Field names mapped to array-likes of values (broadcastable)
+
+            Returns:
+                Dictionary mapping every field name to a NumPy (or CuPy) array
+
+            Raises:
+                ValueError: If the fields can't be calculated, no valid solution exists
+                    for some rows, or the provided values violate the rules
+
+            Example:
+                >>> Sum.from_arrays(a=[1.0, 2.0], b=[3.0, 4.0])["c"]
+                array([4., 6.])
+            """
+            import numpy as np
+
+            xp = _array_module(arrays.values())
+            to_host = getattr(xp, "asnumpy", np.asarray)
+
+            for name in arrays:
+                if name not in field_set:
+                    raise TypeError(
+                        f"{cls.__qualname__}.from_arrays() got an unexpected keyword "
+                        f"argument '{name}'"
+                    )
+
+            known = frozenset(arrays)
+            known_names = sorted(known)
+            columns = {name: xp.asarray(value) for name, value in arrays.items()}
+            shape = np.broadcast_shapes(*(column.shape for column in columns.values()))
+
+            solutions = _symbolic_solutions(known)
+            if not solutions:
+                provided = ", ".join(f"'{f}'" for f in known_names)
+                missing = ", ".join(f"'{f}'" for f in sorted(field_set - known - lambda_fields))
+                raise ValueError(
+                    f"Cannot calculate all fields with the provided arguments.\n"
+                    f"Provided: {provided}\n"
+                    f"Missing: {missing}"
+                )
+
+            funcs = array_funcs.setdefault((known, xp.__name__), {})
+
+            def evaluate(expr: Any, available: dict[str, Any]) -> Any:
+                names = sorted(str(s) for s in expr.free_symbols)
+                func = funcs.get(expr)
+                if func is None:
+                    func = funcs[expr] = lambdify(
+                        [Symbol(n) for n in names], expr, modules=xp.__name__, dummify=True
+                    )
+                return xp.broadcast_to(func(*[available[n] for n in names]), shape)
+
+            # Rows with at least one real branch, to tell why unresolved rows failed
+            has_real = xp.zeros(shape, dtype=bool)
+            branches = []
+            # Per branch, the rows where it is real and satisfies the constraints
+            valid_rows = []
+            with np.errstate(all="ignore"):
+                for solution in solutions:
+                    branch = {name: evaluate(expr, columns) for name, expr in solution.items()}
+                    available = {**columns, **branch}
+                    valid = xp.ones(shape, dtype=bool)
+                    for value in branch.values():
+                        valid &= xp.isfinite(value) & xp.isreal(value)
+                    has_real |= valid
+                    for constraint in constraints:
+                        if {str(s) for s in constraint.free_symbols} <= available.keys():
+                            valid &= evaluate(constraint, available).astype(bool)
+                    branches.append(branch)
+                    valid_rows.append(valid)
+            valid_counts = sum(valid.astype(int) for valid in valid_rows)
+            unresolved = valid_counts == 0
+
+            # Pick, per row, the first valid branch in the order scalar construction tries
+            # them. That order depends on the exact form of each row's values (see
+            # _substitute_solutions()), so rows with several valid branches are ordered
+            # with sympy one at a time.
+            choice = xp.argmax(xp.stack(valid_rows), axis=0)
+            ambiguous = np.argwhere(to_host(valid_counts > 1))
+            if len(ambiguous):
+                host_choice = to_host(choice).copy()
+                host_columns = {
+                    name: np.broadcast_to(to_host(column), shape)
+                    for name, column in columns.items()
+                }
+                host_valid = [to_host(valid) for valid in valid_rows]
+                unknowns_list = [name for name in field_names if name in solutions[0]]
+                for row in map(tuple, ambiguous):
+                    subs = {
+                        symbols[name]: column[row].item() for name, column in host_columns.items()
+                    }
+                    try:
+                        keys = {
+                            index: default_sort_key(
+                                tuple(
+                                    sympify(solution[name].xreplace(subs)) for name in unknowns_list
+                                )
+                            )
+                            for index, solution in enumerate(solutions)
+                            if host_valid[index][row]
+                        }
+                    except Exception:
+                        continue
+                    host_choice[row] = min(keys, key=keys.__getitem__)
+                choice = xp.asarray(host_choice)
+
+            solved: dict[str, Any] = {}
+            for index, branch in enumerate(branches):
+                chosen = ~unresolved & (choice == index)
+                for name, value in branch.items():
+                    solved[name] = xp.where(chosen, xp.real(value), solved.get(name, xp.nan))
+
+            if unresolved.any():
+                errors = []
+                no_real = int((unresolved & ~has_real).sum())
+                if no_real:
+                    errors.append(
+                        f"No real solution exists for {no_real} of {unresolved.size} rows."
+                    )
+                rejected = int((unresolved & has_real).sum())
+                if rejected:
+                    errors.append(
+                        f"No real solution satisfies all constraints for "
+                        f"{rejected} of {unresolved.size} rows."
+                    )
+                raise ValueError("\n".join(errors))
+            columns.update(solved)
+
+            # Lambdas are arbitrary Python, so evaluate them row by row on the host
+            pending = dict(lambdas)
+            while pending:
+                ready = [
+                    name
+                    for name, (_, dependency_fields) in pending.items()
+                    if all(d in columns for d in dependency_fields)
+                ]
+                if not ready:
+                    break
+                for name in ready:
+                    func, dependency_fields = pending.pop(name)
+                    rows = zip(
+                        *(
+                            np.broadcast_to(to_host(columns[d]), shape).ravel()
+                            for d in dependency_fields
+                        )
+                    )
+                    if dependency_fields:
+                        results = [func(*row) for row in rows]
+                    else:
+                        results = [func() for _ in range(int(np.prod(shape)))]
+                    value = xp.asarray(np.array(results).reshape(shape))
+                    # Numbers are compared with a tolerance, like scalar construction does
+                    if name in known and not (
+                        xp.allclose(value, columns[name])
+                        if value.dtype.kind in "biuf" and columns[name].dtype.kind in "biuf"
+                        else xp.array_equal(value, columns[name])
+                    ):
+                        raise ValueError(f"Validation failed for field '{name}'.")
+                    columns[name] = value
+
+            # Validate the provided values against the equations and constraints
+            with np.errstate(all="ignore"):
+                failed = [
+                    str(eq.lhs)
+                    for eq in equations
+                    if not xp.allclose(columns[str(eq.lhs)], evaluate(eq.rhs, columns))
+                ]
+                failed.extend(
+                    str(constraint)
+                    for constraint in constraints
+                    if not evaluate(constraint, columns).all()
+                )
+            if failed:
+                raise ValueError(f"Validation failed for: {', '.join(failed)}")
+
+            return {name: xp.broadcast_to(columns[name], shape) for name in field_names}
+
+        cls._symfields_fields = field_names
+        cls._symfields_assign = staticmethod(assign_fields)
+        cls.__init__ = _make_init(  # type: ignore[method-assign]
+            field_names, f"{cls.__qualname__}.__init__", _init_fields
+        )
         cls.update = update  # type: ignore[assignment]
         cls.__setattr__ = __setattr__  # type: ignore[assignment]
+        cls.from_arrays = staticmethod(from_arrays)  # type: ignore[method-assign,assignment]
 
 
 def replace(obj: T, **kwargs: Any) -> T:
@@ -701,8 +1903,11 @@ def replace(obj: T, **kwargs: Any) -> T:
         Like dataclasses.replace(), this always returns a new instance,
         even if no fields are changed.
     """
-    # Create a copy with all current field values
-    new_obj = type(obj)(**{field: getattr(obj, field) for field in obj.__annotations__})
+    # Copy the current field values; obj is already solved and valid, so there's no need to
+    # go through __init__ again
+    cls = type(obj)
+    new_obj = cls.__new__(cls)
+    cls._symfields_assign(new_obj, {field: getattr(obj, field) for field in cls._symfields_fields})
 
     # Update the copy with new values (if any provided)
     if kwargs:
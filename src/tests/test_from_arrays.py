@@ -0,0 +1,220 @@
+"""Test suite for the vectorized SymFields.from_arrays() classmethod."""
+
+import pytest
+from sympy import sin, sqrt
+
+from symfields import S, SymFields
+
+np = pytest.importorskip("numpy")
+
+
+class TestFromArraysBasic:
+    """Test solving whole arrays of values at once."""
+
+    def test_forward_calculation(self) -> None:
+        """Test calculating c from arrays of a and b."""
+
+        class Sum(SymFields):
+            a: float = S
+            b: float = S
+            c: float = S("a") + S("b")
+
+        result = Sum.from_arrays(a=[1.0, 2.0, 3.0], b=[4.0, 5.0, 6.0])
+        assert list(result) == ["a", "b", "c"]
+        np.testing.assert_allclose(result["c"], [5.0, 7.0, 9.0])
+
+    def test_backward_calculation(self) -> None:
+        """Test inverting the rule over arrays."""
+
+        class Temperature(SymFields):
+            celsius: float = S
+            fahrenheit: float = S("celsius") * 9 / 5 + 32
+
+        result = Temperature.from_arrays(fahrenheit=np.array([32.0, 212.0]))
+        np.testing.assert_allclose(result["celsius"], [0.0, 100.0])
+
+    def test_scalars_broadcast(self) -> None:
+        """Test that scalar inputs broadcast against arrays."""
+
+        class Rectangle(SymFields):
+            width: float = S
+            height: float = S
+            area: float = S("width") * S("height")
+
+        result = Rectangle.from_arrays(width=2.0, area=[10.0, 20.0])
+        np.testing.assert_allclose(result["height"], [5.0, 10.0])
+        np.testing.assert_allclose(result["width"], [2.0, 2.0])
+
+    def test_matches_scalar_construction(self) -> None:
+        """Test that every row matches constructing an instance with the same values."""
+
+        class Motion(SymFields):
+            acceleration: float = S
+            time: float = S
+            top_speed: float = S("acceleration") * S("time")
+            distance: float = 0.5 * S("acceleration") * S("time") ** 2
+
+        times = [1.0, 2.0, 5.0]
+        result = Motion.from_arrays(acceleration=10.0, time=times)
+        for i, time in enumerate(times):
+            motion = Motion(acceleration=10.0, time=time)
+            assert result["top_speed"][i] == pytest.approx(motion.top_speed)
+            assert result["distance"][i] == pytest.approx(motion.distance)
+
+        class Wave(SymFields):
+            phase: float = S
+            height: float = sin(S("phase"))
+            root: float = sqrt(S("height") + 1)
+
+        # Both sin branches are real here, so the row must pick the same one
+        heights = [0.5, -0.5, 0.9]
+        result = Wave.from_arrays(height=heights)
+        for i, height in enumerate(heights):
+            wave = Wave(height=height)
+            assert result["phase"][i] == pytest.approx(wave.phase)
+            assert result["root"][i] == pytest.approx(wave.root)
+
+    def test_lambda_fields(self) -> None:
+        """Test that lambda fields are evaluated for every row."""
+
+        class Rectangle(SymFields):
+            width: float = S
+            height: float = S
+            label: str = S(lambda width, height: f"{width:g}x{height:g}")
+
+        result = Rectangle.from_arrays(width=[1.0, 2.0], height=[3.0, 4.0])
+        assert list(result["label"]) == ["1x3", "2x4"]
+
+    def test_provided_lambda_fields_compared_with_tolerance(self) -> None:
+        """Test provided numeric lambda values are checked like scalar construction does."""
+
+        class Scaled(SymFields):
+            a: float = S
+            b: float = S(lambda a: a * 0.1)
+
+        assert Scaled(a=3.0, b=0.3).b == 0.3
+        result = Scaled.from_arrays(a=[3.0], b=[0.3])
+        np.testing.assert_allclose(result["b"], [0.3])
+
+        with pytest.raises(ValueError, match="Validation failed for field 'b'"):
+            Scaled.from_arrays(a=[3.0], b=[0.4])
+
+
+class TestFromArraysConstraints:
+    """Test solution selection and validation over arrays."""
+
+    def test_constraint_selects_branch(self) -> None:
+        """Test that constraints pick the right solution branch per row."""
+
+        class Foo(SymFields):
+            a: float = S
+            b: float = S("a") ** 2
+
+            __constraints__ = (S("a") > 0,)
+
+        result = Foo.from_arrays(b=[4.0, 9.0, 16.0])
+        np.testing.assert_allclose(result["a"], [2.0, 3.0, 4.0])
+
+    def test_no_valid_solution(self) -> None:
+        """Test error when some rows have no solution satisfying the constraints."""
+
+        class Foo(SymFields):
+            a: float = S
+            b: float = S("a") ** 2
+
+            __constraints__ = (S("a") > 1,)
+
+        with pytest.raises(ValueError, match="satisfies all constraints for 1 of 2 rows"):
+            Foo.from_arrays(b=[4.0, 0.25])
+
+    def test_no_real_solution(self) -> None:
+        """Test error when some rows have no real solution at all."""
+
+        class Foo(SymFields):
+            a: float = S
+            b: float = S("a") ** 2
+
+        with pytest.raises(ValueError, match="No real solution exists for 1 of 2 rows"):
+            Foo.from_arrays(b=[4.0, -1.0])
+
+    def test_validation_error(self) -> None:
+        """Test that inconsistent provided values are rejected."""
+
+        class Sum(SymFields):
+            a: float = S
+            b: float = S
+            c: float = S("a") + S("b")
+
+        with pytest.raises(ValueError, match="Validation failed for: c"):
+            Sum.from_arrays(a=[1.0, 2.0], b=[1.0, 1.0], c=[2.0, 4.0])
+
+    def test_not_enough_arguments(self) -> None:
+        """Test error when the provided fields don't determine the rest."""
+
+        class Sum(SymFields):
+            a: float = S
+            b: float = S
+            c: float = S("a") + S("b")
+
+        with pytest.raises(ValueError, match="Cannot calculate all fields"):
+            Sum.from_arrays(a=[1.0])
+
+    def test_unknown_field(self) -> None:
+        """Test that unknown field names are rejected."""
+
+        class Sum(SymFields):
+            a: float = S
+            b: float = S
+            c: float = S("a") + S("b")
+
+        with pytest.raises(TypeError, match="unexpected keyword argument 'd'"):
+            Sum.from_arrays(a=[1.0], d=[1.0])
+
+
+class TestToArrays:
+    """Test collecting instances into per-field arrays."""
+
+    def test_round_trip(self) -> None:
+        """Test that to_arrays() matches from_arrays() on the same rows."""
+
+        class Sum(SymFields):
+            a: float = S
+            b: float = S
+            c: float = S("a") + S("b")
+
+        result = Sum.to_arrays([Sum(a=1.0, b=4.0), Sum(a=2.0, c=7.0)])
+        assert list(result) == ["a", "b", "c"]
+        expected = Sum.from_arrays(a=[1.0, 2.0], c=[5.0, 7.0])
+        for name in result:
+            np.testing.assert_allclose(result[name], expected[name])
+
+    def test_empty(self) -> None:
+        """Test that no instances give empty arrays."""
+
+        class Sum(SymFields):
+            a: float = S
+            b: float = S
+            c: float = S("a") + S("b")
+
+        result = Sum.to_arrays([])
+        assert all(len(column) == 0 for column in result.values())
+
+    def test_base_class_has_no_fields(self) -> None:
+        """Test that the SymFields base class gives no columns."""
+        assert SymFields.to_arrays([]) == {}
+
+
+class TestFromArraysCupy:
+    """Test evaluating batches on the GPU with CuPy."""
+
+    def test_cupy_arrays_stay_on_device(self) -> None:
+        """Test that CuPy inputs are solved with CuPy and return CuPy arrays."""
+        cp = pytest.importorskip("cupy")
+
+        class Temperature(SymFields):
+            celsius: float = S
+            fahrenheit: float = S("celsius") * 9 / 5 + 32
+
+        result = Temperature.from_arrays(fahrenheit=cp.asarray([32.0, 212.0]))
+        assert isinstance(result["celsius"], cp.ndarray)
+        np.testing.assert_allclose(cp.asnumpy(result["celsius"]), [0.0, 100.0])
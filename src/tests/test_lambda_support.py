@@ -269,6 +269,49 @@ class TestLambdaEdgeCases:
         assert ch.b == 10
         assert ch.c == 20
 
+    def test_lambda_dependencies_defined_out_of_order(self) -> None:
+        """Test lambda that depends on a lambda defined after it."""
+
+        class Chained(SymFields):
+            a: float = S
+            c: float = S(lambda b: b + 10)
+            b: float = S(lambda a: a * 2)
+
+        ch = Chained(a=5)
+        assert ch.b == 10
+        assert ch.c == 20
+
+    def test_lambda_cyclic_dependencies(self) -> None:
+        """Test lambdas depending on each other in a cycle, with one of them provided."""
+
+        class Cycle(SymFields):
+            a: float = S(lambda c: c - 2)
+            b: float = S(lambda a: a + 1)
+            c: float = S(lambda b: b + 1)
+
+        cy = Cycle(b=2)
+        assert cy.a == 1
+        assert cy.c == 3
+
+    def test_computed_lambda_called_once(self) -> None:
+        """Test that a computed lambda isn't called again just to validate it."""
+        calls = []
+
+        def double(a: float) -> float:
+            calls.append(a)
+            return a * 2
+
+        class Doubled(SymFields):
+            a: float = S
+            b: float = S(double)
+
+        assert Doubled(a=3).b == 6
+        assert calls == [3]
+
+        # Provided values are still checked against the lambda
+        with pytest.raises(ValueError, match="Validation failed"):
+            Doubled(a=3, b=7)
+
     def test_lambda_calling_complex_expression(self) -> None:
         """Test lambda with complex internal logic."""
 
@@ -1,12 +1,16 @@
 """Test suite for SymFields library."""
 
+import abc
+import inspect
 import math
+import weakref
 from decimal import ROUND_DOWN, ROUND_HALF_UP, ROUND_UP, Decimal
 from typing import Annotated, Any
 
 import pytest
-from sympy import cos, exp, log, pi, sin, sqrt, tan
+from sympy import Integer, cos, exp, log, pi, sin, sqrt, tan
 
+import symfields
 from symfields import S, SymFields
 
 
@@ -226,6 +230,39 @@ class TestValidation:
         with pytest.raises(ValueError, match="Cannot calculate all fields"):
             Complex()
 
+    def test_extraneous_root_rejected(self) -> None:
+        """Test that a solved value that doesn't satisfy its own rule is rejected."""
+
+        class Root(SymFields):
+            a: float = S
+            c: float = S(sqrt(S("a")))
+            d: float = S("c") + 1
+
+        assert Root(d=3).c == 2.0
+
+        # Solving gives c = -2, a = 4, but sqrt(4) is 2, not -2
+        with pytest.raises(ValueError):
+            Root(d=-1)
+
+    def test_solution_through_zero_division_rejected(self) -> None:
+        """Test that a solution simplified past a 0/0 in its rule is rejected."""
+
+        class Physics(SymFields):
+            distance: float = S
+            speed: float = S
+            time: float = S("distance") / S("speed")
+            average_speed: float = S("distance") / S("time")
+
+        assert Physics(distance=10, speed=2).average_speed == 2.0
+
+        # average_speed solves to speed, but its rule is distance / time = 0 / 0
+        with pytest.raises(ValueError):
+            Physics(distance=0, speed=1)
+
+        # time itself is 0 / 0 here, which is undefined rather than 0
+        with pytest.raises(ValueError):
+            Physics(distance=0, speed=0)
+
     def test_multiple_validation_errors(self) -> None:
         """Test that all validation errors are collected and displayed."""
 
@@ -324,6 +361,104 @@ class TestDataclassBehavior:
         assert hasattr(s, "b")
         assert hasattr(s, "c")
 
+    def test_instances_use_slots(self) -> None:
+        """Test that fields are stored in __slots__ rather than an instance __dict__."""
+
+        class Sum(SymFields):
+            a: float = S
+            b: float = S
+            c: float = S("a") + S("b")
+
+        s = Sum(a=1, b=2)
+        assert Sum.__slots__ == ("a", "b", "c")
+        assert not hasattr(s, "__dict__")
+        with pytest.raises(AttributeError):
+            s.note = "not a field"  # type: ignore[attr-defined]
+
+    def test_instances_support_weakref(self) -> None:
+        """Test that slotted instances can still be weakly referenced."""
+
+        class Sum(SymFields):
+            a: float = S
+            b: float = S
+            c: float = S("a") + S("b")
+
+        s = Sum(a=1, b=2)
+        ref = weakref.ref(s)
+        assert ref() is s
+
+    def test_abstract_base_class(self) -> None:
+        """Test that SymFields can be combined with abc.ABC and abstract methods."""
+
+        class Shape(SymFields, abc.ABC):
+            width: float = S
+            height: float = S
+            area: float = S("width") * S("height")
+
+            @abc.abstractmethod
+            def describe(self) -> str: ...
+
+        with pytest.raises(TypeError, match="abstract"):
+            Shape(width=2, height=3)  # type: ignore[abstract]
+
+        class Describable(abc.ABC):
+            @abc.abstractmethod
+            def describe(self) -> str: ...
+
+        class Rectangle(SymFields, Describable):
+            width: float = S
+            height: float = S
+            area: float = S("width") * S("height")
+
+            def describe(self) -> str:
+                return f"{self.width:g}x{self.height:g}"
+
+        r = Rectangle(width=2, height=3)
+        assert r.area == 6
+        assert r.describe() == "2x3"
+        assert isinstance(r, Describable)
+
+    def test_unexpected_keyword_argument(self) -> None:
+        """Test that unknown keyword arguments are rejected like in dataclasses."""
+
+        class Sum(SymFields):
+            a: float = S
+            b: float = S
+            c: float = S("a") + S("b")
+
+        with pytest.raises(TypeError, match="unexpected keyword argument 'd'"):
+            Sum(a=1, b=2, d=4)  # type: ignore[call-arg]
+
+    def test_init_signature(self) -> None:
+        """Test that __init__ takes each field as a keyword-only parameter."""
+
+        class Sum(SymFields):
+            a: float = S
+            b: float = S
+            c: float = S("a") + S("b")
+
+        parameters = inspect.signature(Sum).parameters
+        assert list(parameters) == ["a", "b", "c"]
+        assert all(p.kind is inspect.Parameter.KEYWORD_ONLY for p in parameters.values())
+
+        with pytest.raises(TypeError, match="positional argument"):
+            Sum(1, 2)  # type: ignore[misc]
+
+    def test_post_init_called(self) -> None:
+        """Test that __post_init__ runs after all fields are solved."""
+        seen = []
+
+        class Sum(SymFields):
+            a: float = S
+            b: float = S
+            c: float = S("a") + S("b")
+
+            def __post_init__(self) -> None:
+                seen.append((self.a, self.b, self.c))
+
+        Sum(a=1, c=3)
+        assert seen == [(1, 2, 3)]
+
 
 class TestEdgeCases:
     """Test edge cases and special scenarios."""
@@ -339,6 +474,11 @@ class TestEdgeCases:
         assert s.a == 1
         assert s.b == 2
 
+    def test_symbols_are_interned(self) -> None:
+        """Test that S('name') returns the same Symbol object every time."""
+        assert S("a") is S("a")
+        assert S("a") is not S("b")
+
     def test_float_precision(self) -> None:
         """Test that float calculations maintain reasonable precision."""
 
@@ -462,6 +602,39 @@ class TestAdvancedMathExpressions:
         assert math.isclose(t2.sine, 1, abs_tol=1e-10)
         assert math.isclose(t2.cosine, 0, abs_tol=1e-10)
 
+    def test_inverse_trigonometric_branch(self) -> None:
+        """Test solving sin for the angle picks the principal branch."""
+
+        class Sine(SymFields):
+            angle: float = S
+            sine: float = S(sin(S("angle")))
+
+        assert math.isclose(Sine(sine=0.5).angle, math.pi / 6)
+        assert math.isclose(Sine(sine=1).angle, math.pi / 2)
+
+    def test_negative_cube_root(self) -> None:
+        """Test solving a cube for a negative value picks the real root."""
+
+        class Cube(SymFields):
+            x: float = S
+            y: float = S("x") ** 3
+
+        assert Cube(y=-8).x == -2.0
+        assert Cube(y=8).x == 2.0
+        assert math.isclose(Cube(y=-2.5).x, -(2.5 ** (1 / 3)))
+
+    def test_branch_choice_independent_of_input_type(self) -> None:
+        """Test that plain and sympy numbers pick the same of several real solutions."""
+
+        class Chain(SymFields):
+            a: float = S
+            b: float = 2 * S("a")
+            c: float = S("b") + 1
+            d: float = S("c") * S("c")
+
+        assert math.isclose(Chain(d=2).c, math.sqrt(2))
+        assert Chain(d=2).c == Chain(d=Integer(2)).c
+
     def test_exponential_and_logarithm(self) -> None:
         """Test exponential and logarithmic functions."""
 
@@ -739,3 +912,105 @@ class TestAnnotatedCastFunctions:
 
             class OptionalParam(SymFields):
                 x: Annotated[Decimal, lambda a, b=1: Decimal(a)] = S
+
+
+class TestSolutionCache:
+    """Test the persistent cache of symbolic solutions."""
+
+    def test_solutions_persisted_to_cache_dir(
+        self, tmp_path: Any, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that solutions are written to and reused from SYMFIELDS_CACHE_DIR."""
+        monkeypatch.setenv("SYMFIELDS_CACHE_DIR", str(tmp_path))
+        # Start from an empty in-memory cache, so the solution has to be persisted
+        monkeypatch.setattr(symfields, "_SOLVE_CACHE", {})
+
+        # Nonlinear, so it goes through solve() rather than the linear fast path
+        class Cube(SymFields):
+            side: float = S
+            volume: float = S("side") ** 3
+
+        assert Cube(volume=8).side == 2
+        cached = list(tmp_path.iterdir())
+        assert len(cached) == 1
+
+        # A new class with the same rules loads the persisted solution, even in a
+        # fresh process (simulated by clearing the in-memory cache)
+        monkeypatch.setattr(symfields, "_SOLVE_CACHE", {})
+        monkeypatch.setattr(symfields, "solve", _fail_solve)
+
+        class Cube2(SymFields):
+            side: float = S
+            volume: float = S("side") ** 3
+
+        assert Cube2(volume=8).side == 2
+        assert list(tmp_path.iterdir()) == cached
+
+    def test_solutions_shared_between_classes(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that classes with the same rules reuse each other's solutions."""
+        monkeypatch.delenv("SYMFIELDS_CACHE_DIR", raising=False)
+
+        class Sphere(SymFields):
+            radius: float = S
+            volume: float = 4 * pi * S("radius") ** 3 / 3
+
+        assert math.isclose(Sphere(volume=36 * math.pi).radius, 3)
+        assert math.isclose(Sphere(radius=3).volume, 36 * math.pi)
+        Sphere(radius=3).update(volume=36 * math.pi)
+
+        monkeypatch.setattr(symfields, "solve", _fail_solve)
+
+        class Sphere2(SymFields):
+            radius: float = S
+            volume: float = 4 * pi * S("radius") ** 3 / 3
+
+        sphere = Sphere2(volume=36 * math.pi)
+        assert math.isclose(sphere.radius, 3)
+        sphere.update(volume=288 * math.pi)
+        assert math.isclose(sphere.radius, 6)
+
+
+def _fail_solve(*args: Any, **kwargs: Any) -> Any:
+    raise AssertionError("solve() should not be called")
+
+
+class TestInstanceCache:
+    """Test memoization of constructions with the cache_size class argument."""
+
+    def test_repeated_construction_is_cached(self) -> None:
+        """Test that identical arguments are only solved once."""
+        calls = []
+
+        def double(a: float) -> float:
+            calls.append(a)
+            return a * 2
+
+        class Cached(SymFields, cache_size=8):
+            a: float = S
+            b: float = S(double)
+
+        assert Cached(a=1).b == 2
+        solved_calls = len(calls)
+        assert Cached(a=1).b == 2
+        assert len(calls) == solved_calls
+
+        # Equal values of different types are solved separately
+        assert Cached(a=1.0).b == 2.0
+        assert len(calls) == 2 * solved_calls
+
+    def test_uncached_by_default(self) -> None:
+        """Test that construction isn't memoized without cache_size."""
+        calls = []
+
+        def double(a: float) -> float:
+            calls.append(a)
+            return a * 2
+
+        class Uncached(SymFields):
+            a: float = S
+            b: float = S(double)
+
+        Uncached(a=1)
+        solved_calls = len(calls)
+        Uncached(a=1)
+        assert len(calls) == 2 * solved_calls
@@ -1,8 +1,10 @@
 """Test suite for SymFields .update() method, __setattr__, and replace()."""
 
+import math
 from decimal import Decimal
 
 import pytest
+import sympy
 
 from symfields import S, SymFields, replace
 
@@ -26,6 +28,49 @@ class TestUpdateBasicForwardPropagation:
         assert sum_.b == 3
         assert sum_.c == 4  # c updated via forward rule
 
+    def test_forward_propagation_keeps_other_inputs_exact(self) -> None:
+        """Test updating an input doesn't re-derive the other inputs from the rules."""
+
+        class Sum(SymFields):
+            a: float = S
+            b: float = S
+            c: float = S("a") + S("b")
+
+        sum_ = Sum(a=0.1, b=0.2)
+        sum_.update(a=0.6)
+        assert sum_.b == 0.2  # Not c - a, which rounds to 0.20000000000000007
+        assert sum_.c == 0.6 + 0.2
+
+    def test_update_field_no_rule_depends_on(self) -> None:
+        """Test updating a free field that no rule reads just stores it."""
+
+        class Offset(SymFields):
+            a: float = S
+            b: float = S
+            c: float = S("b") + 1
+
+        offset = Offset(a=1.0, b=2.0)
+        offset.update(a=5.0)
+        assert (offset.a, offset.b, offset.c) == (5.0, 2.0, 3.0)
+
+        offset.a = 6.0
+        assert offset.a == 6.0
+
+    def test_forward_propagation_without_real_result(self) -> None:
+        """Test a forward update whose result isn't real fails and leaves the instance as is."""
+
+        class Root(SymFields):
+            square: float = S
+            root: float = S("square") ** 0.5
+
+        root = Root(square=4.0)
+        with pytest.raises(ValueError, match="Cannot determine"):
+            root.update(square=-4.0)
+        assert (root.square, root.root) == (4.0, 2.0)
+
+        root.update(square=9.0)
+        assert root.root == 3.0
+
     def test_multiple_forward_propagation(self) -> None:
         """Test updating propagates through multiple dependent fields."""
 
@@ -103,6 +148,32 @@ class TestUpdateNoChange:
         assert sum_.b == 3
         assert sum_.c == 4
 
+    def test_update_with_current_values_does_nothing(self) -> None:
+        """Test that writing back unchanged values skips propagation entirely."""
+        calls = []
+
+        def make_label(width: float, height: float) -> str:
+            calls.append((width, height))
+            return f"{width}x{height}"
+
+        class Rectangle(SymFields):
+            width: float = S
+            height: float = S
+            area: float = S("width") * S("height")
+            label: str = S(make_label)
+
+        rect = Rectangle(width=5.0, height=3.0)
+        calls.clear()
+
+        rect.update(width=5.0, area=15.0)
+        rect.height = 3.0
+        assert calls == []
+        assert (rect.width, rect.height, rect.area) == (5.0, 3.0, 15.0)
+
+        rect.update(width=5.0, height=4.0)
+        assert calls
+        assert (rect.area, rect.label) == (20.0, "5.0x4.0")
+
 
 class TestUpdateMultipleFields:
     """Test updating multiple fields at once."""
@@ -203,6 +274,25 @@ class TestUpdateWithDecimalPrecision:
         assert price.subtotal == Decimal("20.00")
         assert price.total == Decimal("24.60")  # Still 2 decimal places
 
+    def test_update_gives_same_type_as_construction(self) -> None:
+        """Test that a Decimal field without a cast function keeps one type throughout."""
+
+        class Money(SymFields):
+            price: Decimal = S
+            qty: Decimal = S
+            total: Decimal = S("price") * S("qty")
+
+        money = Money(price=Decimal("1.10"), qty=Decimal("3"))
+        constructed_type = type(money.total)
+
+        money.update(qty=Decimal("7"))
+        assert type(money.total) is constructed_type
+        assert money.total == pytest.approx(7.7)
+        assert type(Money(price=Decimal("1.10"), qty=Decimal("7")).total) is constructed_type
+
+        money.qty = Decimal("8")
+        assert type(money.total) is constructed_type
+
 
 class TestUpdateErrorCases:
     """Test error cases and edge cases for update."""
@@ -223,6 +313,12 @@ class TestUpdateErrorCases:
         with pytest.raises(ValueError, match=r"Cannot determine|ambiguous|under-constrained"):
             rect.update(area=30.0)
 
+        # The unsolved fields are listed as a plain set
+        with pytest.raises(ValueError) as exc_info:
+            rect.update(area=30.0)
+        assert "frozenset" not in str(exc_info.value)
+        assert "'width'" in str(exc_info.value)
+
     def test_update_independent_field_propagates_forward(self) -> None:
         """Test that updating an independent field propagates forward correctly."""
 
@@ -302,6 +398,46 @@ class TestUpdateComplexScenarios:
         assert chain.c == 10
         assert chain.d == 11  # Forward from c
 
+    def test_update_inverts_to_real_cube_root(self) -> None:
+        """Test inverting a cube for a negative value picks the real root."""
+
+        class Cube(SymFields):
+            x: float = S
+            y: float = S("x") ** 3
+
+        cube = Cube(x=2)
+        cube.update(y=-8)
+        assert cube.x == -2.0
+
+    def test_update_inverts_to_principal_branch(self) -> None:
+        """Test inverting sin picks the same branch as solving for the angle."""
+
+        class Sine(SymFields):
+            angle: float = S
+            sine: float = S(sympy.sin(S("angle")))
+
+        sine = Sine(angle=0.1)
+        sine.update(sine=0.5)
+        assert math.isclose(sine.angle, math.pi / 6)
+
+    def test_propagation_independent_of_definition_order(self) -> None:
+        """Test that a chain defined out of dependency order propagates both ways."""
+
+        class ReversedChain(SymFields):
+            d: int = S("c") + 1
+            c: int = S("b") + 1
+            b: int = S("a") + 1
+            a: int = S
+
+        chain = ReversedChain(a=1)
+        assert (chain.b, chain.c, chain.d) == (2, 3, 4)
+
+        chain.update(d=10)
+        assert (chain.a, chain.b, chain.c) == (7, 8, 9)
+
+        chain.update(a=0)
+        assert (chain.b, chain.c, chain.d) == (1, 2, 3)
+
 
 class TestSetattr:
     """Test __setattr__ integration with constraint propagation."""
@@ -532,6 +668,25 @@ class TestReplace:
         assert new.b == original.b
         assert new.c == original.c
 
+    def test_replace_does_not_resolve_unchanged_fields(self) -> None:
+        """Test that replace copies current values instead of recomputing them."""
+        calls = []
+
+        def double(a: float) -> float:
+            calls.append(a)
+            return a * 2
+
+        class Doubled(SymFields):
+            a: float = S
+            b: float = S(double)
+
+        original = Doubled(a=1)
+        calls.clear()
+
+        new = replace(original)
+        assert (new.a, new.b) == (1, 2)
+        assert calls == []
+
     def test_replace_validation_error(self) -> None:
         """Test that replace raises validation errors."""
 